@@ -1,9 +1,21 @@
 import argparse
 from src.controller import Controller
 from src.views.cli import CLIView
-from src.views.gui import GUIView
+from src.views.progress import ProgressView
 import logging
 
+def device(spec: str):
+    """Parse an input device given as INDEX or INDEX:TAG."""
+    index, _, tag = spec.partition(":")
+    return int(index), tag or None
+
+def positive(value: str) -> int:
+    """Parse an integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     # Debug command
     parser = argparse.ArgumentParser(description="CLI for TTS and STT using Linguist")
@@ -12,6 +24,15 @@ def main():
     parser.add_argument("--output_file", type=str, default="output.wav", help="Output file for TTS")
     parser.add_argument("--archive", type=str, default="archive", help="Archive directory for TTS")
     parser.add_argument("--whisper_model", type=str, default="base", help="Whisper model for STT")
+    parser.add_argument("--memory_budget", type=float, help="RAM budget in MB for resident models (LRU eviction)")
+    parser.add_argument("--idle_timeout", type=float, help="Seconds of inactivity before a model is unloaded")
+    parser.add_argument("--profile", type=str, choices=["fast", "balanced", "accurate"], help="Whisper decoding profile")
+    parser.add_argument("--whisper_language", type=str, help="Language hint for STT; skips language detection")
+    parser.add_argument("--beam_size", type=positive, help="Beam size for STT decoding (greedy if unset)")
+    parser.add_argument("--fallback", action=argparse.BooleanOptionalAction, help="Toggle temperature fallback re-decoding")
+    parser.add_argument("--condition_on_previous_text", action=argparse.BooleanOptionalAction, help="Toggle prompting with the previous window's text")
+    parser.add_argument("--device", type=device, action="append", help="Input device as INDEX or INDEX:TAG; repeat to record several at once")
+    parser.add_argument("--model_store", type=str, default="models", help="Directory of memory-mapped model weights")
     parser.add_argument("--debug", action="store_true", help="Toggle debugging mode")
     
     subparsers = parser.add_subparsers(dest="command")
@@ -22,6 +43,8 @@ def main():
     speak_parser.add_argument("--tag", type=str, help="Tag the recorded audio file")
     speak_parser.add_argument("--language", type=str, help="Language for TTS")
     speak_parser.add_argument("--speaker", type=str, help="Speaker for TTS")
+    speak_parser.add_argument("--from_file", "--from-file", type=str, help="Synthesize each line of a text file ('-' for stdin)")
+    speak_parser.add_argument("--batch_size", type=positive, default=32, help="Lines read and synthesized per batch with --from_file")
 
     # Listen command
     listen_parser = subparsers.add_parser("listen", help="Convert speech to text")
@@ -33,6 +56,24 @@ def main():
     transcribe_parser.add_argument("--path", type=str, required=True, help="Path to the audio file to transcribe")
     transcribe_parser.add_argument("--print", action="store_true", default=True, help="Flag to print the transcribed text")
     transcribe_parser.add_argument("--tag", type=str, help="Tag the transcribed audio file")
+    transcribe_parser.add_argument("--model", type=str, help="Whisper model for this transcription (default --whisper_model)")
+    transcribe_mode = transcribe_parser.add_mutually_exclusive_group()
+    transcribe_mode.add_argument("--translate", action="store_true", help="Also detect the language and translate to English, sharing one encoder pass (segments are whole 30 s windows)")
+    transcribe_mode.add_argument("--cascade", type=str, help="Larger Whisper model to re-transcribe low-confidence segments with")
+    transcribe_parser.add_argument("--logprob_threshold", type=float, default=-1.0, help="Escalate segments with avg_logprob below this")
+    transcribe_parser.add_argument("--no_speech_threshold", type=float, default=0.6, help="Treat segments above this no_speech_prob as silence")
+    transcribe_parser.add_argument("--compression_ratio_threshold", type=float, default=2.4, help="Escalate segments with compression ratio above this")
+
+    # Search command
+    search_parser = subparsers.add_parser("search", help="Search archived transcripts")
+    search_parser.add_argument("--query", type=str, required=True, help="Full-text query (SQLite FTS5 syntax)")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum number of hits to show")
+    search_parser.add_argument("--sync", action="store_true", help="Index transcripts added to the archive outside Linguist first")
+
+    # Store command
+    store_parser = subparsers.add_parser("store", help="Convert model weights for memory-mapped loading")
+    store_parser.add_argument("--model", type=str, help="Whisper model to convert (default --whisper_model)")
+    store_parser.add_argument("--benchmark", action="store_true", help="Report load time and memory before and after conversion")
 
     # Archive command
     archive_parser = subparsers.add_parser("list", help="List all recorded audio samples")
@@ -43,19 +84,32 @@ def main():
 
     args = parser.parse_args()
 
-    view = GUIView() if args.gui else CLIView()
+    view = ProgressView() if args.gui else CLIView()
 
     lc = Controller(
             view=view,
             output_file=args.output_file,
             archive=args.archive,
-            whisper_model=args.whisper_model
+            whisper_model=args.whisper_model,
+            memory_budget=args.memory_budget,
+            idle_timeout=args.idle_timeout,
+            decoding={
+                "profile": args.profile,
+                "language": args.whisper_language,
+                "beam_size": args.beam_size,
+                "fallback": args.fallback,
+                "condition_on_previous_text": args.condition_on_previous_text
+            },
+            devices=args.device,
+            model_store=args.model_store
         )
 
-    lc.init(args.debug)
-    if args.gui:
-        lc.start()
-    elif args.command in lc.services():
+    if args.debug:
+        logging.basicConfig(level=logging.INFO)
+
+    if not lc.init(args.debug):
+        return
+    if args.command in lc.services():
         lc.execute(args.command, args)
     else:
         parser.print_help()
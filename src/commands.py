@@ -2,13 +2,16 @@ from abc import ABC, abstractmethod
 import inspect
 import sys
 import os
+import time
 from dataclasses import fields
 from typing import Optional, Dict
 from dataclasses import dataclass
 from wave import Error as WaveError
 
 from .models.linguist import Linguist
-from .models.microphone import AudioInfo
+from .models.microphone import AudioInfo, CaptureStream
+from .models.cascade import Thresholds
+from .models.index import QueryError
 from .views.abstract import AbstractView
 
 @dataclass
@@ -107,6 +110,8 @@ class speak(command):
         super().__init__(view)
 
     def execute(self, args, linguist):
+        if args.from_file:
+            return self.batch(args, linguist)
         if not args.tag:
             args.tag = self.view.get_tag() or linguist.stamp()
         if args.speaker:
@@ -120,6 +125,25 @@ class speak(command):
         except Exception as e:
             self.view.throw(self.name, e)
 
+    def batch(self, args, linguist):
+        """Synthesize every line of ``--from_file`` (``-`` for stdin)."""
+        if args.speaker:
+            linguist.set_voice(args.speaker)
+        try:
+            self.view.synthesizing()
+            if args.from_file == "-":
+                report = linguist.speak_batch(sys.stdin, args.tag or "speak", args.batch_size)
+            else:
+                prefix = args.tag or os.path.splitext(os.path.basename(args.from_file))[0]
+                with open(args.from_file, 'r', encoding='utf-8') as f:
+                    report = linguist.speak_batch(f, prefix, args.batch_size)
+            self.view.report(self.name, report.as_dict())
+            self.view.success(self.name, linguist.archive)
+        except KeyboardInterrupt:
+            self.view.interrupt(self.name)
+        except Exception as e:
+            self.view.throw(self.name, e)
+
     @property
     def name(self):
         return "speak"
@@ -137,24 +161,42 @@ class listen(command):
             if not args.tag:
                 args.tag = self.view.get_tag() or linguist.stamp()
             
-            # Ensure proper Windows path handling
-            name = os.path.join(linguist.archive, f"{args.tag}.wav" if not args.tag.endswith(".wav") else args.tag)
-            name = os.path.normpath(name)  # Normalize path separators
-            os.makedirs(os.path.dirname(name), exist_ok=True) # Ensure directory exists
+            streams = self.streams(linguist, args.tag)
+            for stream in streams:
+                os.makedirs(os.path.dirname(stream.output_file), exist_ok=True) # Ensure directory exists
 
-            self.start_recording(linguist, name)
+            self.start_recording(linguist, streams)
             self.view.recording()
 
             try:
-                while True:
-                    pass  # Keep recording until interrupted
+                # Keep recording until interrupted (or every stream has failed) without starving the capture threads
+                while self.recording_thread.is_alive():
+                    time.sleep(0.1)
             except KeyboardInterrupt:
-                self.stop_recording()
-                self.view.success(self.name, name)
-                text, artifact = linguist.transcribe(name)
+                pass
+            self.stop_recording()
+            texts = []
+            for stream in streams:
+                if stream.error:
+                    label = stream.tag or stream.device_index
+                    if os.path.exists(stream.output_file):
+                        self.view.throw(self.name, f"{label}: {stream.error} (partial recording kept at {stream.output_file})")
+                    else:
+                        self.view.throw(self.name, f"{label}: {stream.error}")
+                    continue
+                if len(streams) > 1 or stream.dropped or stream.overflows:
+                    self.view.report(self.name, {
+                        "stream": stream.tag or stream.device_index,
+                        "seconds": stream.frames / linguist.mic.sample_rate,
+                        "dropped": stream.dropped,
+                        "overflows": stream.overflows
+                    })
+                self.view.success(self.name, stream.output_file)
+                text, artifact = linguist.transcribe(stream.output_file)
                 if text and args.print:
                     self.view.transcription(text)
-                return text
+                texts.append(text)
+            return "\n".join(texts)
         except KeyboardInterrupt:
             self.view.interrupt(self.name)
             return ""
@@ -165,11 +207,31 @@ class listen(command):
             self.view.throw(self.name, e)
             return ""
 
-    def start_recording(self, linguist: Linguist, name: str):
+    def streams(self, linguist: Linguist, tag: str):
+        """One capture stream per configured device, each saved under its own tag."""
+        tag = tag[:-len(".wav")] if tag.endswith(".wav") else tag
+        devices = linguist.mic.devices
+        streams = []
+        for index, device_tag in devices:
+            if device_tag:
+                stream_tag = f"{tag}-{device_tag}"
+            elif len(devices) > 1:
+                stream_tag = f"{tag}-dev{index}"
+            else:
+                stream_tag = tag
+            # Ensure proper Windows path handling
+            name = os.path.normpath(os.path.join(linguist.archive, f"{stream_tag}.wav"))
+            if any(stream.output_file == name for stream in streams):
+                # Two streams writing one file would interleave into a corrupt recording.
+                raise ValueError(f"Device {index} would record to {name} twice. Give each --device a distinct index and tag.")
+            streams.append(CaptureStream(index, stream_tag, name))
+        return streams
+
+    def start_recording(self, linguist: Linguist, streams):
         if self.recording_thread and self.recording_thread.is_alive():
             return
         self.stop_event.clear()
-        self.recording_thread = Thread(target=linguist.mic.record, args=(name, self.stop_event))
+        self.recording_thread = Thread(target=linguist.mic.capture, args=(streams, self.stop_event))
         self.recording_thread.start()
     
     def stop_recording(self):
@@ -193,10 +255,31 @@ class transcribe(command):
                 raise FileNotFoundError(f"Audio file not found at {file_path}")
                 
             self.view.transcribing()
-            text, artifact = linguist.transcribe(args.path, tag=args.tag)
+            translation = None
+            if args.translate:
+                result, artifact = linguist.multitask(args.path, tag=args.tag, model=args.model)
+                self.view.report(self.name, {
+                    "language": result.language,
+                    "probability": result.language_probs.get(result.language, 0.0)
+                })
+                text, translation = result.text, result.translation
+            elif args.cascade:
+                thresholds = Thresholds(
+                    logprob=args.logprob_threshold,
+                    no_speech=args.no_speech_threshold,
+                    compression_ratio=args.compression_ratio_threshold
+                )
+                text, artifact, report = linguist.cascade(
+                    args.path, args.cascade, tag=args.tag, model=args.model, thresholds=thresholds
+                )
+                self.view.report(self.name, report.as_dict())
+            else:
+                text, artifact = linguist.transcribe(args.path, tag=args.tag, model=args.model)
             if text:
                 if args.print:
                     self.view.transcription(text)
+            if translation and args.print:
+                self.view.transcription(translation)
 
             if args.tag and artifact:
                 self.view.success(self.name, artifact)
@@ -212,6 +295,47 @@ class transcribe(command):
     @property
     def name(self):
         return "transcribe"
+
+
+class store(command):
+    def __init__(self, view: AbstractView):
+        super().__init__(view)
+
+    def execute(self, args, linguist):
+        try:
+            artifact = linguist.convert(args.model)
+            self.view.success(self.name, artifact)
+            if args.benchmark:
+                for source, stats in linguist.benchmark(args.model).items():
+                    self.view.report(f"{self.name} ({source})", stats)
+        except KeyboardInterrupt:
+            self.view.interrupt(self.name)
+        except Exception as e:
+            self.view.throw(self.name, e)
+
+    @property
+    def name(self):
+        return "store"
+
+
+class search(command):
+    def __init__(self, view: AbstractView):
+        super().__init__(view)
+
+    def execute(self, args, linguist):
+        try:
+            results = linguist.search(args.query, limit=args.limit, sync=args.sync)
+            self.view.hits(results)
+        except QueryError as e:
+            self.view.throw(self.name, e)
+        except KeyboardInterrupt:
+            self.view.interrupt(self.name)
+        except Exception as e:
+            self.view.throw(self.name, e)
+
+    @property
+    def name(self):
+        return "search"
     
 # class start(command):
 #     def __init__(self, view: AbstractView):
@@ -2,6 +2,7 @@ from .models.linguist import Linguist
 from .commands import get_commands
 from .views.abstract import AbstractView
 from .views.lib import NoView
+from .models.decoding import ConfigError
 
 class Controller:
     def __init__(
@@ -10,13 +11,24 @@ class Controller:
             whisper_model="base",
             output_file="output.wav",
             archive="archive",
+            memory_budget=None,
+            idle_timeout=None,
+            decoding=None,
+            devices=None,
+            model_store="models",
         ):
         self.linguist = Linguist(
             output_file=output_file,
             archive=archive,
-            whisper_model=whisper_model
+            whisper_model=whisper_model,
+            memory_budget=memory_budget,
+            idle_timeout=idle_timeout,
+            decoding=decoding,
+            devices=devices,
+            model_store=model_store
         )
         self.view = view
+        self.commands = {}
 
     def __getattr__(self, name: str) -> callable:
         """Dynamically handle command calls as methods."""
@@ -25,22 +37,30 @@ class Controller:
             def command_wrapper(args):
                 return command.execute(args, self.linguist)
             return command_wrapper
-        raise AttributeError(f"Command '{name}' not found. Must be one of: " + ', '.join(self.services))
+        raise AttributeError(f"Command '{name}' not found. Must be one of: " + ', '.join(self.services()))
     
-    def init(self, debug):
+    def init(self, debug) -> bool:
         try:
             self.linguist.init(debug)
             self.commands = get_commands(self.view)
-        except PermissionError and TypeError as e:
-            self.view.throw(f"Error: {e}")
-            return
+            if type(self.view).progress is not AbstractView.progress:
+                # Hooking Whisper's progress bar serializes transcriptions, so only do it for views that show it.
+                self.linguist.on_progress = self.view.progress
+        except (PermissionError, TypeError, ConfigError) as e:
+            self.view.throw("init", e)
+            self.view.close()
+            return False
+        return True
         
     def execute(self, command_name: str, args: dict):
         command = self.commands.get(command_name)
         if command:
-            command.execute(args, self.linguist)
+            try:
+                command.execute(args, self.linguist)
+            finally:
+                self.view.close()
         else:
-            self.view.warn("Command not found. Must be one of: " + ', '.join(self.services))
+            self.view.warn("Command not found. Must be one of: " + ', '.join(self.services()))
 
     def services(self):
         if not self.commands:
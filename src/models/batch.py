@@ -0,0 +1,42 @@
+import hashlib
+from itertools import islice
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+@dataclass
+class BatchReport:
+    lines: int = 0
+    synthesized: int = 0
+    skipped: int = 0
+    characters: int = 0
+    seconds: float = 0.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.characters / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats["chars_per_second"] = round(self.chars_per_second, 2)
+        return stats
+
+
+def derived_tag(prefix: str, text: str, voice: Optional[str]=None) -> str:
+    """Tag a line by its content and voice so re-running the same input finds earlier results."""
+    key = f"{voice}\n{text}" if voice else text
+    return f"{prefix}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+
+
+def batches(lines: Iterable[str], prefix: str, size: int, voice: Optional[str]=None) -> Iterator[List[Tuple[str, str]]]:
+    """Stream ``(text, tag)`` pairs in groups of ``size``, skipping blank lines.
+
+    Only one batch is held at a time, so memory stays flat however long the input is.
+    """
+    if size < 1:
+        raise ValueError(f"Batch size must be at least 1, got {size}")
+    entries = ((line.strip(), derived_tag(prefix, line.strip(), voice)) for line in lines if line.strip())
+    while True:
+        batch = list(islice(entries, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,87 @@
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Tuple
+
+SAMPLE_RATE = 16000  # whisper.audio.SAMPLE_RATE; load_audio always resamples to this
+
+@dataclass
+class Thresholds:
+    """Per-segment confidence limits; defaults mirror Whisper's own fallback thresholds."""
+    logprob: float = -1.0
+    no_speech: float = 0.6
+    compression_ratio: float = 2.4
+
+    def low_confidence(self, segment: Dict[str, Any]) -> bool:
+        # Whisper treats quiet, low-probability segments as silence; escalating those wastes work.
+        if segment["no_speech_prob"] > self.no_speech and segment["avg_logprob"] < self.logprob:
+            return False
+        return segment["avg_logprob"] < self.logprob or segment["compression_ratio"] > self.compression_ratio
+
+
+@dataclass
+class CascadeReport:
+    segments: int
+    escalated_segments: int
+    audio_seconds: float
+    escalated_seconds: float
+    draft_model: str = ""
+    escalation_model: str = ""
+
+    @property
+    def escalated_fraction(self) -> float:
+        return self.escalated_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats["escalated_fraction"] = round(self.escalated_fraction, 4)
+        return stats
+
+
+def spans(segments: List[Dict[str, Any]], thresholds: Thresholds) -> List[Tuple[int, int]]:
+    """Group consecutive low-confidence segments into ``(first, last)`` index ranges."""
+    ranges = []
+    for i, segment in enumerate(segments):
+        if not thresholds.low_confidence(segment):
+            continue
+        if ranges and ranges[-1][1] == i - 1:
+            ranges[-1] = (ranges[-1][0], i)
+        else:
+            ranges.append((i, i))
+    return ranges
+
+
+def cascade(audio, draft, escalation, thresholds: Thresholds, **options) -> Tuple[str, List[Dict[str, Any]], CascadeReport]:
+    """Transcribe ``audio`` with ``draft`` and redo low-confidence spans with ``escalation``.
+
+    Adjacent low-confidence segments are re-transcribed as one span so the
+    larger model gets the surrounding context instead of isolated fragments.
+    Returns the merged text, the merged segments (timestamps in seconds from
+    the start of ``audio``) and a report of how much audio was escalated.
+    """
+    segments = draft.transcribe(audio, **options)["segments"]
+    ranges = spans(segments, thresholds)
+    replacements = {}
+    escalated_seconds = 0.0
+    for first, last in ranges:
+        start, end = segments[first]["start"], segments[last]["end"]
+        clip = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+        replacements[first] = [
+            {**segment, "start": segment["start"] + start, "end": min(segment["end"] + start, end)}
+            for segment in escalation.transcribe(clip, **options)["segments"]
+        ]
+        escalated_seconds += end - start
+
+    escalated = {i for first, last in ranges for i in range(first, last + 1)}
+    merged = []
+    for i, segment in enumerate(segments):
+        if i in replacements:
+            merged.extend(replacements[i])
+        elif i not in escalated:
+            merged.append(segment)
+
+    report = CascadeReport(
+        segments=len(segments),
+        escalated_segments=len(escalated),
+        audio_seconds=len(audio) / SAMPLE_RATE,
+        escalated_seconds=escalated_seconds
+    )
+    return "".join(segment["text"] for segment in merged), merged, report
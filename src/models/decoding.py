@@ -0,0 +1,99 @@
+import os
+import json
+from typing import Any, Dict, Optional
+
+ARCHIVE_CONFIG = "linguist.json"
+
+# Whisper retries a segment at each temperature in turn when it fails the
+# compression/logprob checks, so the tuple length bounds the decodes per segment.
+FALLBACK_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+PROFILES: Dict[str, Dict[str, Any]] = {
+    # Greedy, single pass, no fallback and no dependency on the previous window.
+    "fast": {
+        "temperature": 0.0,
+        "beam_size": None,
+        "best_of": None,
+        "condition_on_previous_text": False,
+    },
+    "balanced": {
+        "temperature": (0.0, 0.4, 0.8),
+        "beam_size": None,
+        "best_of": 3,
+        "condition_on_previous_text": True,
+    },
+    "accurate": {
+        "temperature": FALLBACK_TEMPERATURES,
+        "beam_size": 5,
+        "best_of": 5,
+        "condition_on_previous_text": True,
+    },
+}
+
+
+# Keys allowed in the archive config and the type each value must have.
+ARCHIVE_KEYS = {
+    "profile": str,
+    "language": str,
+    "beam_size": int,
+    "fallback": bool,
+    "condition_on_previous_text": bool,
+}
+
+
+class ConfigError(ValueError):
+    """Raised when an archive's decoding config cannot be used."""
+
+
+def archive_defaults(archive: str) -> Dict[str, Any]:
+    """Read per-archive decoding defaults (e.g. ``{"language": "en"}``) if configured."""
+    path = os.path.join(archive, ARCHIVE_CONFIG)
+    if not os.path.isfile(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ConfigError(f"{path} is not valid JSON: {e}") from e
+    if not isinstance(config, dict):
+        raise ConfigError(f"{path} must contain a JSON object")
+    for key, value in config.items():
+        expected = ARCHIVE_KEYS.get(key)
+        if expected is None:
+            raise ConfigError(f"{path}: unknown key '{key}'. Must be one of: " + ', '.join(ARCHIVE_KEYS))
+        # bool is a subclass of int, so reject it explicitly where a number is expected.
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise ConfigError(f"{path}: '{key}' must be of type {expected.__name__}, got {json.dumps(value)}")
+    if "profile" in config and config["profile"] not in PROFILES:
+        raise ConfigError(f"{path}: unknown profile '{config['profile']}'. Must be one of: " + ', '.join(PROFILES))
+    if "beam_size" in config and config["beam_size"] < 1:
+        raise ConfigError(f"{path}: 'beam_size' must be at least 1")
+    return config
+
+
+def decoding_options(
+        profile: Optional[str]=None,
+        language: Optional[str]=None,
+        beam_size: Optional[int]=None,
+        fallback: Optional[bool]=None,
+        condition_on_previous_text: Optional[bool]=None
+    ) -> Dict[str, Any]:
+    """Build keyword arguments for ``whisper_model.transcribe``.
+
+    Starts from the named profile (Whisper's own defaults if none) and applies
+    any explicit overrides on top. A known ``language`` skips detection.
+    """
+    if profile and profile not in PROFILES:
+        raise ValueError(f"Unknown decoding profile '{profile}'. Must be one of: " + ', '.join(PROFILES))
+    options = dict(PROFILES.get(profile, {}))
+    if language:
+        options["language"] = language
+    if beam_size is not None:
+        options["beam_size"] = beam_size
+    if fallback is not None:
+        temperature = options.get("temperature", FALLBACK_TEMPERATURES)
+        first = temperature[0] if isinstance(temperature, (tuple, list)) else temperature
+        options["temperature"] = FALLBACK_TEMPERATURES if fallback else first
+    if condition_on_previous_text is not None:
+        options["condition_on_previous_text"] = condition_on_previous_text
+    return options
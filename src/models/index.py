@@ -0,0 +1,182 @@
+import os
+import wave
+import sqlite3
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    tag TEXT NOT NULL,
+    audio TEXT,
+    duration REAL,
+    recorded TEXT,
+    mtime REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    transcript_id INTEGER NOT NULL REFERENCES transcripts(id),
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS segments_transcript ON segments(transcript_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text,
+    content = 'segments',
+    content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+-- Keep the external-content FTS table in step with segments.
+CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts (segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+# Messages SQLite uses for a malformed MATCH expression, as opposed to database failures.
+QUERY_ERRORS = ("fts5: syntax error", "unterminated string", "no such column")
+
+
+class QueryError(ValueError):
+    """Raised when a search query is not valid FTS5 syntax."""
+
+
+@dataclass
+class SearchHit:
+    tag: str
+    transcript: str
+    audio: Optional[str]
+    duration: Optional[float]
+    recorded: Optional[str]
+    start_ms: int
+    end_ms: int
+    snippet: str
+    score: float
+
+
+class TranscriptIndex:
+    """Incremental SQLite FTS5 index over the archive's transcript sidecars.
+
+    Each transcript is stored as one row of audio metadata plus one row per
+    Whisper segment, so hits point at the matching span of audio. Segments
+    are looked up by transcript through a plain index, which keeps
+    re-indexing a single transcript cheap however large the archive grows.
+    Transcripts are keyed by their path relative to the archive holding the
+    index, so the archive can be given differently from run to run.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.root = os.path.dirname(os.path.abspath(path))
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def add(self, transcript: str, segments: List[Dict[str, Any]], audio: str=None):
+        """Index (or re-index) ``transcript`` from Whisper-style segments in seconds."""
+        tag = os.path.splitext(os.path.basename(transcript))[0]
+        duration = _duration(audio) if audio else None
+        source = audio if audio and os.path.exists(audio) else transcript
+        recorded = datetime.fromtimestamp(os.path.getmtime(source)).isoformat(timespec="seconds")
+        key = self._key(transcript)
+        with self.db:
+            row = self.db.execute("SELECT id FROM transcripts WHERE path = ?", (key,)).fetchone()
+            if row:
+                self.db.execute("DELETE FROM segments WHERE transcript_id = ?", (row[0],))
+                self.db.execute(
+                    "UPDATE transcripts SET tag = ?, audio = ?, duration = ?, recorded = ?, mtime = ? WHERE id = ?",
+                    (tag, audio, duration, recorded, os.path.getmtime(transcript), row[0])
+                )
+                transcript_id = row[0]
+            else:
+                transcript_id = self.db.execute(
+                    "INSERT INTO transcripts (path, tag, audio, duration, recorded, mtime) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, tag, audio, duration, recorded, os.path.getmtime(transcript))
+                ).lastrowid
+            self.db.executemany(
+                "INSERT INTO segments (text, transcript_id, start_ms, end_ms) VALUES (?, ?, ?, ?)",
+                [
+                    (segment["text"].strip(), transcript_id, round(segment["start"] * 1000), round(segment["end"] * 1000))
+                    for segment in segments
+                ]
+            )
+
+    def sync(self, archive: str) -> int:
+        """Index sidecars written outside Linguist and drop deleted ones. Returns files indexed."""
+        known = dict(self.db.execute("SELECT path, mtime FROM transcripts"))
+        seen = set()
+        indexed = 0
+        for entry in os.scandir(archive):
+            if not entry.name.lower().endswith(".txt"):
+                continue
+            key = self._key(entry.path)
+            seen.add(key)
+            if known.get(key) == entry.stat().st_mtime:
+                continue
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            audio = os.path.splitext(entry.path)[0] + ".wav"
+            audio = audio if os.path.exists(audio) else None
+            # Plain sidecars carry no timestamps, so the whole file becomes a single segment.
+            end = _duration(audio) if audio else 0.0
+            self.add(entry.path, [{"text": text, "start": 0.0, "end": end or 0.0}], audio=audio)
+            indexed += 1
+        for key in set(known) - seen:
+            self.remove(os.path.join(self.root, key))
+        return indexed
+
+    def remove(self, transcript: str):
+        with self.db:
+            row = self.db.execute("SELECT id FROM transcripts WHERE path = ?", (self._key(transcript),)).fetchone()
+            if row:
+                self.db.execute("DELETE FROM segments WHERE transcript_id = ?", (row[0],))
+                self.db.execute("DELETE FROM transcripts WHERE id = ?", (row[0],))
+
+    def search(self, query: str, limit: int=20) -> List[SearchHit]:
+        """Best-ranked matching segments first (FTS5 query syntax).
+
+        Raises QueryError for a malformed query; other database errors propagate.
+        """
+        try:
+            return self._search(query, limit)
+        except sqlite3.OperationalError as e:
+            if any(message in str(e) for message in QUERY_ERRORS):
+                raise QueryError(f"Invalid search query: {e}") from e
+            raise
+
+    def _search(self, query: str, limit: int) -> List[SearchHit]:
+        rows = self.db.execute(
+            """
+            SELECT t.tag, t.path, t.audio, t.duration, t.recorded,
+                   s.start_ms, s.end_ms,
+                   snippet(segments_fts, 0, '[', ']', '…', 12),
+                   segments_fts.rank
+            FROM segments_fts
+            JOIN segments s ON s.id = segments_fts.rowid
+            JOIN transcripts t ON t.id = s.transcript_id
+            WHERE segments_fts MATCH ?
+            ORDER BY segments_fts.rank
+            LIMIT ?
+            """,
+            (query, limit)
+        )
+        return [SearchHit(tag, os.path.join(self.root, key), *rest) for tag, key, *rest in rows]
+
+    def close(self):
+        self.db.close()
+
+    def _key(self, transcript: str) -> str:
+        return os.path.normpath(os.path.relpath(os.path.abspath(transcript), self.root))
+
+
+def _duration(audio: str) -> Optional[float]:
+    try:
+        with wave.open(audio, 'rb') as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    except (OSError, EOFError, wave.Error):
+        return None
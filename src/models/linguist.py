@@ -1,23 +1,70 @@
 import os
+import time
 import whisper
 import warnings
+import importlib
+from threading import Lock
+from functools import partial
 from datetime import datetime
+from types import SimpleNamespace
+from contextlib import contextmanager
 
 from ..packages.tts.controller import Controller as tts
 from .microphone import Microphone, AudioInfo
+from .residency import ModelResidency
+from .cascade import Thresholds, cascade
+from .decoding import archive_defaults, decoding_options
+from .index import TranscriptIndex
+from .store import convert_whisper, load_whisper, measure_fresh
+from .batch import BatchReport, batches
+from .multitask import TASKS, multitask
 
 warnings.filterwarnings("ignore", message="FP16 is not supported on CPU; using FP32 instead") # Ignore FP16 warning because it defaults to FP32
 
+FRAMES_PER_SECOND = whisper.audio.SAMPLE_RATE // whisper.audio.HOP_LENGTH  # mel frames per second of audio
+_progress_lock = Lock()
+
+class _ProgressBar:
+    """Stand-in for the tqdm bar in ``whisper.transcribe`` that forwards progress in seconds."""
+    def __init__(self, callback, total=None, **kwargs):
+        self.callback = callback
+        self.total = total or 0
+        self.n = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def update(self, n=1):
+        self.n += n
+        self.callback(self.n / FRAMES_PER_SECOND, self.total / FRAMES_PER_SECOND)
+
+
 class Linguist:
     def __init__(
             self, 
             whisper_model="base",
             output_file="output.wav",
-            archive="archive"
+            archive="archive",
+            memory_budget=None,
+            idle_timeout=None,
+            decoding=None,
+            devices=None,
+            model_store="models"
         ):
         self.default_output = output_file
         self.archive = archive
         self.whisper_model = whisper_model
+        self.voice = None
+        self.devices = devices
+        self.model_store = model_store
+        self.on_progress = None
+        self.decoding_overrides = {key: value for key, value in (decoding or {}).items() if value is not None}
+        self.decoding = {}
+        budget = int(memory_budget * 1024 * 1024) if memory_budget is not None else None
+        self.models = ModelResidency(budget_bytes=budget, idle_timeout=idle_timeout)
 
     def init(self, debug: bool=False):
         if not os.path.exists(self.archive):
@@ -28,17 +75,59 @@ class Linguist:
         except PermissionError as e:
             raise (f"Warning: Could not set archive permissions: {e}")
         self.debug = debug
-        self.tts = tts(debug=debug)
-        self.tts.load()
-        self.mic: Microphone = Microphone()
-        self.whisper_model = whisper.load_model(self.whisper_model)
+        # Explicit CLI choices win over the archive's defaults, which win over the profile.
+        self.decoding = decoding_options(**{**archive_defaults(self.archive), **self.decoding_overrides})
+        self.mic: Microphone = Microphone(devices=self.devices)
+        self.index = TranscriptIndex(os.path.join(self.archive, "index.db"))
+        self.models.register("whisper", partial(load_whisper, store=self.model_store))
+        self.models.register("tts", self._load_tts)
+        if self.models.idle_timeout is not None:
+            self.models.start(interval=min(self.models.idle_timeout, 30.0))
+
+    def _load_tts(self, _variant: str=""):
+        engine = tts(debug=self.debug)
+        engine.load()
+        if self.voice:
+            engine.handle_set_voice(self.voice)
+        return engine
+
+    def tts_engine(self):
+        """Lease the TTS engine, reloading it on demand if it was evicted."""
+        return self.models.use("tts/default")
+
+    def whisper(self, name: str=None):
+        """Lease the named Whisper model (default ``--whisper_model``), loading it on demand."""
+        return self.models.use(f"whisper/{name or self.whisper_model}")
+
+    def convert(self, name: str=None) -> str:
+        """Convert a Whisper model into the mmap-friendly model store."""
+        name = name or self.whisper_model
+        path = convert_whisper(name, self.model_store)
+        self.models.evict(f"whisper/{name}", reason="converted")  # Next use maps the stored weights
+        return path
+
+    def benchmark(self, name: str=None) -> dict:
+        """Load time and resident memory from the original checkpoint and from the store."""
+        name = name or self.whisper_model
+        return {
+            "checkpoint": measure_fresh(name),
+            "store": measure_fresh(name, self.model_store)
+        }
 
     def set_voice(self, voice: str):
-        self.tts.handle_set_voice(voice)
+        self.voice = voice
+        with self.tts_engine() as engine:
+            engine.handle_set_voice(voice)
 
     def stamp(self):
         return datetime.now().strftime("%Y-%m-%d@%H%M%S")
     
+    def search(self, query: str, limit: int=20, sync: bool=False):
+        """Ranked transcript segments matching ``query``."""
+        if sync:
+            self.index.sync(self.archive)
+        return self.index.search(query, limit=limit)
+
     def samples(self) -> AudioInfo:
         """List all recorded audio samples with formatted output."""
         return self.mic.samples(self.archive)
@@ -51,7 +140,8 @@ class Linguist:
             output_file = tag + ".wav"
         else:
             output_file = tag
-        self.tts.handle_generate_speech(words, output_file)
+        with self.tts_engine() as engine:
+            engine.handle_generate_speech(words, output_file)
     
     def speak(self, text: str, tag: str=None, voice: str=None):
         """Convert text to speech and play it."""
@@ -62,21 +152,121 @@ class Linguist:
         else:
             path = os.path.join(self.archive, tag)
         self.generate(text, path)
+        return path
+
+    def speak_batch(self, lines, prefix: str, batch_size: int=32) -> BatchReport:
+        """Synthesize each line of ``lines`` into the archive under a tag derived from it.
+
+        Tags hash the line together with the active voice, and lines whose
+        audio already exists are skipped, so an interrupted run can simply be
+        restarted; each file only appears once fully written. The engine is
+        resolved once per batch rather than per line, and only one batch of
+        input is held in memory at a time.
+        """
+        report = BatchReport()
+        started = time.perf_counter()
+        for batch in batches(lines, prefix, batch_size, self.voice):
+            report.lines += len(batch)
+            pending = {}
+            for text, tag in batch:
+                path = os.path.join(self.archive, tag + ".wav")
+                if os.path.exists(path) or path in pending:
+                    report.skipped += 1
+                else:
+                    pending[path] = text
+            if not pending:
+                continue
+            with self.tts_engine() as engine:
+                for path, text in pending.items():
+                    # Synthesize beside the target and rename, so an interrupted line never
+                    # leaves a file that the next run would skip as done. Keep the .wav
+                    # suffix because the audio writer picks its format from the extension.
+                    staging = path[:-len(".wav")] + ".partial.wav"
+                    try:
+                        engine.handle_generate_speech(text, staging)
+                        os.replace(staging, path)
+                    finally:
+                        if os.path.exists(staging):
+                            os.remove(staging)
+                    report.synthesized += 1
+                    report.characters += len(text)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    @contextmanager
+    def reporting(self):
+        """Route Whisper's progress bar to ``on_progress`` while transcribing."""
+        if not self.on_progress:
+            yield
+            return
+        module = importlib.import_module("whisper.transcribe")
+        with _progress_lock:
+            original = module.tqdm
+            module.tqdm = SimpleNamespace(tqdm=partial(_ProgressBar, self.on_progress))
+            try:
+                yield
+            finally:
+                module.tqdm = original
 
-    def transcribe(self, file: str, tag: str=None) -> str:
+    def transcribe(self, file: str, tag: str=None, model: str=None) -> str:
         """Transcribe recorded audio to text."""
-        result = self.whisper_model.transcribe(file)
+        with self.whisper(model) as stt, self.reporting():
+            result = stt.transcribe(file, **self.decoding)
         text = result["text"]
-                    
+        return text, self._write_transcript(text, tag, result["segments"], file)
+
+    def cascade(self, file: str, escalation: str, tag: str=None, model: str=None, thresholds: Thresholds=None) -> tuple:
+        """Transcribe with the cheap model, re-transcribing low-confidence spans with ``escalation``."""
+        draft_name = model or self.whisper_model
+        audio = whisper.load_audio(file)
+        # Lease both models up front so loading the larger one cannot evict the draft.
+        with self.whisper(draft_name) as draft, self.whisper(escalation) as larger, self.reporting():
+            text, segments, report = cascade(
+                audio,
+                draft,
+                larger,
+                thresholds or Thresholds(),
+                **self.decoding
+            )
+        report.draft_model = draft_name
+        report.escalation_model = escalation
+        return text, self._write_transcript(text, tag, segments, file), report
+
+    def multitask(self, file: str, tag: str=None, model: str=None, tasks=TASKS) -> tuple:
+        """Language ID, transcript and English translation from one encoder pass per window.
+
+        With a tag, the transcript is written to ``<tag>.txt`` and the
+        translation to ``<tag>.en.txt``, both indexed for search. Returns the
+        result and the transcript's path (or None).
+        """
+        with self.whisper(model) as stt:
+            result = multitask(
+                stt,
+                whisper.load_audio(file),
+                tasks=tasks,
+                progress=self.on_progress,
+                **self.decoding
+            )
+        artifact = None
         if tag:
-            if not tag.endswith(".txt"):
-                tag += ".txt"
-            output_path = os.path.join(self.archive, tag)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
-            tag = output_path
-
-        return text, tag
+            tag = tag[:-len(".txt")] if tag.endswith(".txt") else tag
+            if result.segments:
+                artifact = self._write_transcript(result.text, tag, result.segments, file)
+            if result.translated_segments:
+                self._write_transcript(result.translation, f"{tag}.en", result.translated_segments, file)
+        return result, artifact
+
+    def _write_transcript(self, text: str, tag: str=None, segments: list=None, audio: str=None):
+        """Write ``text`` as a ``.txt`` sidecar in the archive and index it; returns its path or None."""
+        if not tag:
+            return tag
+        if not tag.endswith(".txt"):
+            tag += ".txt"
+        output_path = os.path.join(self.archive, tag)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self.index.add(output_path, segments or [{"text": text, "start": 0.0, "end": 0.0}], audio=audio)
+        return output_path
 
 
 # if __name__ == '__main__':
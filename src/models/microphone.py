@@ -2,8 +2,11 @@ import os
 import wave
 import pyaudio
 from enum import Enum
-from threading import Event
+from queue import Full, Queue
+from threading import Event, Thread
 from collections import namedtuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 class AudioInfo(Enum):
     FILE = 'file'
@@ -13,40 +16,135 @@ class AudioInfo(Enum):
     SAMPLE_WIDTH = 'sample_width'
 
 
+@dataclass
+class CaptureStream:
+    """One input device being captured, with its own output file and counters."""
+    device_index: Optional[int]
+    tag: str
+    output_file: str
+    frames: int = 0
+    dropped: int = 0  # chunks discarded because the writer pool fell behind
+    overflows: int = 0  # input overflows reported by the audio driver
+    error: Optional[Exception] = None
+
+
 class Microphone:
-    def __init__(self, device_index=None):
+    def __init__(self, device_index=None, devices: List[Tuple[Optional[int], Optional[str]]]=None, writers: int=2):
         self.device_index = device_index  # Optional: Use a specific microphone device
+        self.devices = devices or [(device_index, None)]  # (device_index, tag) pairs to capture together
         self.sample_rate = 16000
         self.chunk_size = 1024  # Buffer size for audio chunks
         self.format = pyaudio.paInt32  # Audio format
         self.channels = 1  # Mono audio
+        self.writers = writers  # Writer threads shared by all devices
+        self.queue_size = 256  # Chunks buffered per writer before capture starts dropping
         self.p = pyaudio.PyAudio()
         self.recording_thread = None
 
     def record(self, output_file: str, stop_event: Event):
         """Start recording audio to a file until the stop_event is set."""
-        """Records audio until the stop_event is set."""
-        stream = self.p.open(format=self.format,
-                             channels=self.channels,
-                             rate=self.sample_rate,
-                             input=True,
-                             frames_per_buffer=self.chunk_size,
-                             input_device_index=self.device_index)
+        self.capture([CaptureStream(self.device_index, "", output_file)], stop_event)
+
+    def capture(self, streams: List[CaptureStream], stop_event: Event):
+        """Record every stream concurrently until the stop_event is set.
 
-        frames = []
+        Each device gets its own capture thread so a slow device never stalls
+        the others; chunks are handed to a small shared pool of writer threads
+        that append them to disk, keeping memory bounded however long we record.
+        A stream is always written by the same writer so its chunks stay in order.
 
-        while not stop_event.is_set():
-            data = stream.read(self.chunk_size)
-            frames.append(data)
+        A stream that fails to open, record or write gets ``error`` set and
+        stops on its own; the others carry on. Its file is removed if no audio
+        reached it.
+        """
+        files = {}
+        for stream in streams:
+            try:
+                files[id(stream)] = self._open(stream.output_file)
+            except Exception as e:
+                stream.error = e
+        recording = [stream for stream in streams if id(stream) in files]
 
-        stream.stop_stream()
-        stream.close()
+        pool = [Queue(maxsize=self.queue_size) for _ in range(max(1, min(self.writers, len(recording))))]
+        writers = [Thread(target=self._write, args=(queue, files)) for queue in pool]
+        workers = [
+            Thread(target=self._capture, args=(stream, pool[i % len(pool)], stop_event))
+            for i, stream in enumerate(recording)
+        ]
+        for thread in writers + workers:
+            thread.start()
+        for worker in workers:
+            worker.join()
+        for queue in pool:
+            queue.put(None)
+        for writer in writers:
+            writer.join()
+        for stream in recording:
+            try:
+                files[id(stream)].close()
+            except Exception as e:
+                stream.error = stream.error or e
+            if stream.error and not stream.frames and os.path.exists(stream.output_file):
+                os.remove(stream.output_file)  # Header only; don't leave an empty sample in the archive
 
-        with wave.open(output_file, 'wb') as wf:
+    def _open(self, output_file: str) -> wave.Wave_write:
+        wf = wave.open(output_file, 'wb')
+        try:
             wf.setnchannels(self.channels)
             wf.setsampwidth(self.p.get_sample_size(self.format))
             wf.setframerate(self.sample_rate)
-            wf.writeframes(b''.join(frames))
+        except Exception:
+            wf.close()
+            os.remove(output_file)
+            raise
+        return wf
+
+    def _capture(self, stream: CaptureStream, queue: Queue, stop_event: Event):
+        try:
+            self._read(stream, queue, stop_event)
+        except Exception as e:
+            # Keep the other devices recording; the caller reports the failure per stream.
+            stream.error = e
+
+    def _read(self, stream: CaptureStream, queue: Queue, stop_event: Event):
+        audio = self.p.open(format=self.format,
+                            channels=self.channels,
+                            rate=self.sample_rate,
+                            input=True,
+                            frames_per_buffer=self.chunk_size,
+                            input_device_index=stream.device_index)
+        try:
+            while not stop_event.is_set() and stream.error is None:
+                try:
+                    data = audio.read(self.chunk_size)
+                except IOError as e:
+                    if getattr(e, "errno", None) != pyaudio.paInputOverflowed:
+                        raise
+                    stream.overflows += 1
+                    continue
+                try:
+                    queue.put_nowait((stream, data))
+                except Full:
+                    stream.dropped += 1
+        finally:
+            audio.stop_stream()
+            audio.close()
+
+    def _write(self, queue: Queue, files: Dict[int, wave.Wave_write]):
+        # Keep draining until the sentinel even after a failed write, so capture
+        # threads never block on a full queue and shutdown always completes.
+        while True:
+            item = queue.get()
+            if item is None:
+                return
+            stream, data = item
+            if stream.error is not None:
+                continue
+            try:
+                files[id(stream)].writeframes(data)
+                stream.frames += self.chunk_size
+            except Exception as e:
+                stream.error = e
 
     def samples(self, output_file: str):
         """List all recorded audio samples in the archive directory, including additional audio quality info."""
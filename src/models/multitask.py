@@ -0,0 +1,119 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import torch
+from whisper.audio import N_FRAMES, N_SAMPLES, log_mel_spectrogram, pad_or_trim
+from whisper.decoding import DecodingOptions, decode
+
+FRAMES_PER_SECOND = 100  # mel frames per second of audio (SAMPLE_RATE / HOP_LENGTH)
+TASKS = ("detect", "transcribe", "translate")
+
+@dataclass
+class MultiTaskResult:
+    language: Optional[str]
+    language_probs: Dict[str, float]
+    text: str = ""
+    translation: Optional[str] = None
+    segments: List[Dict[str, Any]] = field(default_factory=list)
+    translated_segments: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def multitask(
+        model,
+        audio,
+        tasks=TASKS,
+        language: Optional[str]=None,
+        temperature=0.0,
+        beam_size: Optional[int]=None,
+        condition_on_previous_text: bool=True,
+        no_speech_threshold: Optional[float]=0.6,
+        logprob_threshold: Optional[float]=-1.0,
+        fp16: bool=True,
+        progress: Optional[Callable[[float, float], None]]=None,
+        **_
+    ) -> MultiTaskResult:
+    """Detect language, transcribe and translate ``audio`` from one encoder pass per window.
+
+    The log-mel and encoder output of each 30-second window are computed once
+    and handed to language detection and every decoding task, so each extra
+    task costs decoder time only. Windows are fixed and non-overlapping, and
+    each task decodes a window once at the first temperature of the profile
+    (no fallback re-decoding). Windows Whisper would treat as silence are
+    dropped from every task, using ``whisper.transcribe``'s thresholds.
+    Extra keyword arguments from a decoding profile are accepted and ignored.
+    """
+    if isinstance(temperature, (tuple, list)):
+        temperature = temperature[0]
+    fp16 = fp16 and model.device.type != "cpu"  # Whisper's decoder only runs fp16 on GPU
+    dtype = torch.float16 if fp16 else torch.float32
+    decoders = [task for task in ("transcribe", "translate") if task in tasks]
+
+    mel = log_mel_spectrogram(audio, model.dims.n_mels, padding=N_SAMPLES)
+    content_frames = mel.shape[-1] - N_FRAMES
+    seeks = range(0, max(content_frames, 1), N_FRAMES)
+    detect = "detect" in tasks or not language
+    result = MultiTaskResult(language=language, language_probs={})
+    prompts: Dict[str, List[int]] = {task: [] for task in decoders}
+    outputs: Dict[str, List[Dict[str, Any]]] = {task: [] for task in decoders}
+
+    # Windows are processed one at a time so memory stays flat however long the audio is.
+    for seek in seeks:
+        window = pad_or_trim(mel[:, seek:seek + N_FRAMES], N_FRAMES).to(model.device).to(dtype)
+        with torch.no_grad():
+            features = model.embed_audio(window.unsqueeze(0))
+        window_language = result.language
+        if detect:
+            # detect_language and decode both skip the encoder when handed its output.
+            _, window_probs = model.detect_language(features)
+            for code, p in window_probs[0].items():
+                result.language_probs[code] = result.language_probs.get(code, 0.0) + p / len(seeks)
+            window_language = max(window_probs[0], key=window_probs[0].get)
+            # Like Whisper, decode in the language detected in the first window unless given one.
+            result.language = result.language or window_language
+
+        start = seek / FRAMES_PER_SECOND
+        end = min(seek + N_FRAMES, content_frames) / FRAMES_PER_SECOND
+        decodes = {}
+        for task in decoders:
+            options = DecodingOptions(
+                task=task,
+                language=result.language,
+                temperature=temperature,
+                beam_size=beam_size if temperature == 0 else None,
+                without_timestamps=True,
+                prompt=prompts[task] if condition_on_previous_text else None,
+                fp16=fp16
+            )
+            decoded = decodes[task] = decode(model, features, options)[0]
+            if len(decodes) == 1 and _silent(decoded, no_speech_threshold, logprob_threshold):
+                # Decoding silence yields hallucinations ("Thank you."), so skip the window for every task.
+                decodes = {}
+                break
+        for task, decoded in decodes.items():
+            prompts[task] = decoded.tokens
+            outputs[task].append({
+                "start": start,
+                "end": end,
+                "text": " " + decoded.text.strip(),
+                "language": window_language,
+                "avg_logprob": decoded.avg_logprob,
+                "no_speech_prob": decoded.no_speech_prob,
+                "compression_ratio": decoded.compression_ratio
+            })
+        if progress:
+            progress(end, content_frames / FRAMES_PER_SECOND)
+
+    if "transcribe" in outputs:
+        result.segments = outputs["transcribe"]
+        result.text = "".join(segment["text"] for segment in result.segments)
+    if "translate" in outputs:
+        result.translated_segments = outputs["translate"]
+        result.translation = "".join(segment["text"] for segment in result.translated_segments)
+    return result
+
+
+def _silent(decoded, no_speech_threshold: Optional[float], logprob_threshold: Optional[float]) -> bool:
+    """Whisper's no-speech gate: likely silence, unless the decode is confident anyway."""
+    if no_speech_threshold is None or decoded.no_speech_prob <= no_speech_threshold:
+        return False
+    return logprob_threshold is None or decoded.avg_logprob <= logprob_threshold
@@ -0,0 +1,183 @@
+import os
+import time
+import logging
+from contextlib import contextmanager
+from threading import Event, RLock, Thread
+from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ResidentModel:
+    """A loaded model and the bookkeeping used to decide when to evict it."""
+    name: str
+    model: Any
+    bytes: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    hits: int = 0
+    leases: int = 0  # callers currently using the model; leased models are never evicted
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process, or 0 where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def footprint(model: Any) -> int:
+    """Estimate the bytes held by a model's tensors (torch modules only)."""
+    if not (hasattr(model, "parameters") and hasattr(model, "buffers")):
+        return 0
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+class ModelResidency:
+    """Loads models by name on demand and evicts them by LRU order.
+
+    Loaders are registered per family (e.g. ``whisper``) and receive the
+    variant part of a ``family/variant`` name, so ``whisper/tiny`` and
+    ``whisper/small`` can be resident side by side. Models are evicted
+    least-recently-used first once ``budget_bytes`` is exceeded, or once
+    they have been idle for longer than ``idle_timeout`` seconds.
+    """
+
+    def __init__(self, budget_bytes: Optional[int]=None, idle_timeout: Optional[float]=None):
+        self.budget_bytes = budget_bytes
+        self.idle_timeout = idle_timeout
+        self._loaders: Dict[str, Callable[[str], Any]] = {}
+        self._models: "OrderedDict[str, ResidentModel]" = OrderedDict()
+        self._listeners: List[Callable[[str, ResidentModel], None]] = []
+        self._lock = RLock()
+        self._stop = Event()
+        self._reaper: Optional[Thread] = None
+
+    def register(self, family: str, loader: Callable[[str], Any]):
+        """Register the loader used for every ``family/variant`` name."""
+        self._loaders[family] = loader
+
+    def subscribe(self, listener: Callable[[str, ResidentModel], None]):
+        """Call ``listener(event, entry)`` on every ``load`` and ``evict``."""
+        self._listeners.append(listener)
+
+    def get(self, name: str) -> Any:
+        """Return the named model, loading it first if it is not resident.
+
+        The model may be evicted as soon as this returns; use ``use`` to hold it.
+        """
+        with self._lock:
+            entry = self._acquire(name)
+            self.sweep()
+            return entry.model
+
+    @contextmanager
+    def use(self, name: str):
+        """Lease the named model for the duration of the block so it cannot be evicted."""
+        with self._lock:
+            entry = self._acquire(name)
+            entry.leases += 1
+            self.sweep()
+        try:
+            yield entry.model
+        finally:
+            with self._lock:
+                entry.leases -= 1
+                entry.last_used = time.monotonic()
+                # Nothing else re-checks the budget when no sweeper thread is running.
+                self.sweep()
+
+    def evict(self, name: str, reason: str="manual") -> bool:
+        """Drop the named model. Returns False if it was not resident."""
+        with self._lock:
+            entry = self._models.pop(name, None)
+        if entry is None:
+            return False
+        logger.info("Evicted %s (%s, %.1f MB)", name, reason, entry.bytes / (1024 * 1024))
+        self._emit("evict", entry)
+        return True
+
+    def sweep(self):
+        """Evict idle models, then LRU models until within the memory budget.
+
+        Leased models and the most recently used one are never evicted, so the
+        budget can be exceeded while more models than it allows are in use.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.idle_timeout is not None:
+                for name, entry in list(self._models.items()):
+                    if not entry.leases and now - entry.last_used > self.idle_timeout:
+                        self.evict(name, reason="idle")
+            if self.budget_bytes is not None:
+                candidates = [entry.name for entry in list(self._models.values())[:-1] if not entry.leases]
+                while candidates and self.resident_bytes() > self.budget_bytes:
+                    self.evict(candidates.pop(0), reason="budget")
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.bytes for entry in self._models.values())
+
+    def residency(self) -> List[ResidentModel]:
+        """Snapshot of resident models, least recently used first."""
+        with self._lock:
+            return list(self._models.values())
+
+    def start(self, interval: float=30.0):
+        """Run ``sweep`` periodically in a daemon thread so idle models are released."""
+        if self._reaper and self._reaper.is_alive():
+            return
+        self._stop.clear()
+        self._reaper = Thread(target=self._reap, args=(interval,), daemon=True)
+        self._reaper.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._reaper:
+            self._reaper.join()
+            self._reaper = None
+
+    def clear(self):
+        for name in [entry.name for entry in self.residency()]:
+            self.evict(name, reason="clear")
+
+    def _acquire(self, name: str) -> ResidentModel:
+        entry = self._models.get(name)
+        if entry is None:
+            entry = self._load(name)
+        entry.last_used = time.monotonic()
+        entry.hits += 1
+        self._models.move_to_end(name)
+        return entry
+
+    def _load(self, name: str) -> ResidentModel:
+        family, _, variant = name.partition("/")
+        loader = self._loaders.get(family)
+        if loader is None:
+            raise KeyError(f"No loader registered for '{family}'. Must be one of: " + ', '.join(self._loaders))
+        before = _rss_bytes()
+        started = time.monotonic()
+        model = loader(variant)
+        # Prefer the exact tensor size; fall back to the RSS growth observed while loading.
+        size = footprint(model) or max(_rss_bytes() - before, 0)
+        entry = ResidentModel(name=name, model=model, bytes=size)
+        self._models[name] = entry
+        logger.info("Loaded %s in %.2fs (%.1f MB)", name, time.monotonic() - started, size / (1024 * 1024))
+        self._emit("load", entry)
+        return entry
+
+    def _emit(self, event: str, entry: ResidentModel):
+        for listener in self._listeners:
+            try:
+                listener(event, entry)
+            except Exception as e:
+                logger.warning("Residency listener failed on %s: %s", event, e)
+
+    def _reap(self, interval: float):
+        while not self._stop.wait(interval):
+            self.sweep()
@@ -0,0 +1,134 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from dataclasses import asdict
+
+import torch
+import whisper
+from torch import nn
+from whisper.model import AudioEncoder, ModelDimensions, TextDecoder, Whisper
+
+# Weights are stored in the dtype Whisper runs them in on CPU, so loading can
+# map the file directly instead of converting (and thereby copying) each tensor.
+STORE_DTYPE = torch.float32
+
+
+def whisper_path(store: str, name: str) -> str:
+    return os.path.join(store, f"whisper-{name}.pt")
+
+
+def converted(store: str, name: str) -> bool:
+    return bool(store) and os.path.isfile(whisper_path(store, name))
+
+
+def convert_whisper(name: str, store: str) -> str:
+    """Rewrite a Whisper checkpoint into the store as mmap-loadable fp32 tensors."""
+    os.makedirs(store, exist_ok=True)
+    model = whisper.load_model(name, device="cpu")
+    state = {key: tensor.to(STORE_DTYPE).contiguous() for key, tensor in model.state_dict().items()}
+    path = whisper_path(store, name)
+    partial = path + ".partial"
+    torch.save({"dims": asdict(model.dims), "model_state_dict": state}, partial)
+    os.replace(partial, path)  # Never leave a half-written store file behind for other processes
+    return path
+
+
+def _skeleton(dims: ModelDimensions) -> Whisper:
+    """A Whisper whose weights are unallocated meta tensors, built as Whisper.__init__ does.
+
+    Whisper itself cannot be constructed on the meta device (its sparse
+    alignment-heads buffer has no meta kernel), so only the encoder and
+    decoder are, which is where all the weights live.
+    """
+    with torch.device("meta"):
+        encoder = AudioEncoder(dims.n_mels, dims.n_audio_ctx, dims.n_audio_state, dims.n_audio_head, dims.n_audio_layer)
+        decoder = TextDecoder(dims.n_vocab, dims.n_text_ctx, dims.n_text_state, dims.n_text_head, dims.n_text_layer)
+    model = Whisper.__new__(Whisper)
+    nn.Module.__init__(model)
+    model.dims = dims
+    model.encoder = encoder
+    model.decoder = decoder
+    heads = torch.zeros(dims.n_text_layer, dims.n_text_head, dtype=torch.bool)
+    heads[dims.n_text_layer // 2:] = True
+    model.register_buffer("alignment_heads", heads.to_sparse(), persistent=False)
+    return model
+
+
+def load_whisper(name: str, store: str=None, device: str=None) -> Whisper:
+    """Load ``name`` from the store if converted, else fall back to ``whisper.load_model``.
+
+    Stored weights are memory-mapped rather than read into private memory, so
+    several processes on one host share the same page-cache pages and cold
+    start only pays for the pages that are actually touched.
+    """
+    if not converted(store, name):
+        return whisper.load_model(name, device=device)
+    checkpoint = torch.load(whisper_path(store, name), mmap=True, weights_only=True, map_location="cpu")
+    dims = ModelDimensions(**checkpoint["dims"])
+    model = _skeleton(dims)  # Skip allocating and randomly initialising weights we replace below
+    model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+    # The decoder's causal mask is a non-persistent buffer, so it is not in the
+    # checkpoint and is still on the meta device; rebuild it as TextDecoder.__init__ does.
+    mask = torch.empty(dims.n_text_ctx, dims.n_text_ctx).fill_(float("-inf")).triu_(1)
+    model.decoder.register_buffer("mask", mask, persistent=False)
+    if name in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[name])
+    missing = [key for key, tensor in [*model.named_parameters(), *model.named_buffers()] if tensor.is_meta]
+    if missing:
+        # A newer Whisper added state we don't know how to rebuild; refuse rather than fail mid-decode.
+        raise RuntimeError(f"Stored weights for '{name}' left tensors uninitialised: " + ', '.join(missing))
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    return model.to(device)
+
+
+def memory() -> dict:
+    """Resident memory of this process in MB, split into private and file-backed pages."""
+    stats = {}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssFile"):
+                    stats[key] = int(value.split()[0]) / 1024
+    except OSError:
+        import resource
+        stats["VmRSS"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "rss_mb": stats.get("VmRSS"),
+        "private_mb": stats.get("RssAnon"),
+        "shared_file_mb": stats.get("RssFile")
+    }
+
+
+def measure(name: str, store: str=None) -> dict:
+    """Time a load in this process and report memory once every weight has been touched."""
+    started = time.perf_counter()
+    model = load_whisper(name, store, device="cpu")
+    load_seconds = time.perf_counter() - started
+    with torch.no_grad():
+        # Fault every page in so mmap'd weights are counted, not just the ones touched at load.
+        for tensor in model.state_dict().values():
+            tensor.sum()
+    return {"load_seconds": round(load_seconds, 3), **memory()}
+
+
+def measure_fresh(name: str, store: str=None) -> dict:
+    """Run ``measure`` in a new interpreter so earlier loads cannot skew the numbers."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    command = [sys.executable, "-m", "src.models.store", name]
+    if store:
+        command += ["--store", os.path.abspath(store)]
+    output = subprocess.run(command, cwd=root, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure Whisper load time and memory")
+    parser.add_argument("model", type=str, help="Whisper model name")
+    parser.add_argument("--store", type=str, help="Model store to load from (checkpoint if unset)")
+    args = parser.parse_args()
+    print(json.dumps(measure(args.model, args.store)))
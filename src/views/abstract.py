@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Dict
 from datetime import datetime
 
 class AbstractView(ABC):
@@ -35,6 +35,16 @@ class AbstractView(ABC):
         """Display transcribed text."""
         pass
     
+    @abstractmethod
+    def report(self, command: str, stats: Dict[str, Any]) -> None:
+        """Display run statistics for a command."""
+        pass
+    
+    @abstractmethod
+    def hits(self, results: List[Any]) -> None:
+        """Display ranked transcript search results."""
+        pass
+    
     @abstractmethod
     def success(self, command: str, artifact: str) -> None:
         """Show success message with artifact path."""
@@ -55,6 +65,14 @@ class AbstractView(ABC):
         """Get a tag for the current operation."""
         pass
     
+    def progress(self, processed: float, total: float) -> None:
+        """Report seconds of audio processed so far out of ``total``."""
+        pass
+    
+    def close(self) -> None:
+        """Release any resources held by the view once a command has finished."""
+        pass
+    
     def stamp(self) -> str:
         """Generate a timestamp for tagging."""
         return datetime.now().strftime("%Y-%m-%d@%H%M%S")
\ No newline at end of file
@@ -1,5 +1,5 @@
 from .abstract import AbstractView
-from typing import List, Any
+from typing import List, Any, Dict
 import os
 
 class CLIView(AbstractView):
@@ -43,6 +43,21 @@ class CLIView(AbstractView):
     def transcription(self, text: str) -> None:
         print(f"\n❝{text}❞\n")
     
+    def report(self, command: str, stats: Dict[str, Any]) -> None:
+        print(f"📊 {command.title()} report")
+        for key, value in stats.items():
+            if isinstance(value, float):
+                value = f"{value:.4g}"
+            print(f"   {key:<24} {value}")
+    
+    def hits(self, results: List[Any]) -> None:
+        if not results:
+            print("🔍 No matching transcripts.")
+            return
+        for hit in results:
+            print(f"🔍 {hit.tag} [{hit.start_ms}–{hit.end_ms} ms] {hit.recorded or ''}")
+            print(f"   {hit.snippet}")
+    
     def success(self, command: str, artifact: str) -> None:
         print(f"✅ Service {command.title()} complete. Output saved to: {artifact}")
     
@@ -2,7 +2,7 @@ from prompt_toolkit import HTML
 from prompt_toolkit.shortcuts import button_dialog, input_dialog, message_dialog
 from prompt_toolkit.styles import Style
 from .abstract import AbstractView
-from typing import List, Any
+from typing import List, Any, Dict
 import os
 
 class GUIView(AbstractView):
@@ -90,6 +90,27 @@ class GUIView(AbstractView):
             style=self.style
         ).run()
 
+    def report(self, command: str, stats: Dict[str, Any]) -> None:
+        lines = [
+            f"{key}: {value:.4g}" if isinstance(value, float) else f"{key}: {value}"
+            for key, value in stats.items()
+        ]
+        message_dialog(
+            title=f"{command.title()} Report",
+            text="\n".join(lines),
+            style=self.style
+        ).run()
+
+    def hits(self, results: List[Any]) -> None:
+        text = "\n\n".join(
+            f"{hit.tag} [{hit.start_ms}–{hit.end_ms} ms]\n{hit.snippet}" for hit in results
+        )
+        message_dialog(
+            title="Search Results",
+            text=text or "No matching transcripts.",
+            style=self.style
+        ).run()
+
     def success(self, command: str, artifact: str) -> None:
         message_dialog(
             title="Success",
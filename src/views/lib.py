@@ -1,5 +1,5 @@
 from .abstract import AbstractView
-from typing import List, Any
+from typing import List, Any, Dict
 
 class NoView(AbstractView):
     """A view that performs no output operations. Useful for testing or suppressing output."""
@@ -22,6 +22,12 @@ class NoView(AbstractView):
     def transcription(self, text: str) -> None:
         pass
     
+    def report(self, command: str, stats: Dict[str, Any]) -> None:
+        pass
+    
+    def hits(self, results: List[Any]) -> None:
+        pass
+    
     def success(self, command: str, artifact: str) -> None:
         pass
     
@@ -0,0 +1,188 @@
+import os
+import time
+import wave
+import _thread
+from threading import Lock, Thread
+from dataclasses import dataclass
+from typing import List, Any, Dict, Optional
+
+from prompt_toolkit import HTML
+from prompt_toolkit.application import Application
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout import Layout, Window
+from prompt_toolkit.layout.controls import FormattedTextControl
+from prompt_toolkit.shortcuts import message_dialog
+from .gui import GUIView
+
+@dataclass
+class Job:
+    """One unit of work shown in the live progress panel."""
+    command: str
+    started: float
+    processed: float = 0.0
+    total: float = 0.0
+    finished: Optional[float] = None
+    status: str = "running"
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rtf(self) -> Optional[float]:
+        """Real-time factor: wall-clock seconds spent per second of audio."""
+        return self.elapsed / self.processed if self.processed else None
+
+
+class ProgressView(GUIView):
+    """GUI view that runs a live, non-blocking status panel while work proceeds.
+
+    ``synthesizing``/``recording``/``transcribing`` return immediately so the
+    command starts its work right away; the panel redraws in a background
+    thread and result dialogs are deferred until ``close``.
+    """
+
+    refresh_interval = 0.25
+
+    def __init__(self):
+        super().__init__()
+        self.jobs: List[Job] = []
+        self.messages: List[str] = []
+        self._lock = Lock()
+        self._app: Optional[Application] = None
+        self._thread: Optional[Thread] = None
+
+    def synthesizing(self) -> None:
+        self._start("synthesizing")
+
+    def recording(self) -> None:
+        self._start("recording")
+
+    def transcribing(self) -> None:
+        self._start("transcribing")
+
+    def progress(self, processed: float, total: float) -> None:
+        with self._lock:
+            job = self._active()
+        # listen transcribes after recording without announcing it, so adopt the work here.
+        if job is None or job.command != "transcribing":
+            job = self._start("transcribing")
+        job.processed, job.total = processed, total
+
+    def transcription(self, text: str) -> None:
+        self._finish("done")
+        self.messages.append(f"❝{text.strip()}❞")
+
+    def report(self, command: str, stats: Dict[str, Any]) -> None:
+        lines = [
+            f"  {key}: {value:.4g}" if isinstance(value, float) else f"  {key}: {value}"
+            for key, value in stats.items()
+        ]
+        self.messages.append(f"📊 {command.title()} report\n" + "\n".join(lines))
+
+    def hits(self, results: List[Any]) -> None:
+        lines = [f"🔍 {hit.tag} [{hit.start_ms}–{hit.end_ms} ms]\n  {hit.snippet}" for hit in results]
+        self.messages.append("\n".join(lines) or "🔍 No matching transcripts.")
+
+    def success(self, command: str, artifact: str) -> None:
+        job = self._finish("done")
+        if job and not job.processed and str(artifact).endswith(".wav") and os.path.isfile(artifact):
+            with wave.open(artifact, 'rb') as wf:
+                job.processed = job.total = wf.getnframes() / float(wf.getframerate())
+        self.messages.append(f"✅ {command.title()} complete. Output saved to: {artifact}")
+
+    def interrupt(self, command: str) -> None:
+        self._finish("interrupted")
+        self.messages.append(f"⚠️ {command.title()} interrupted.")
+
+    def throw(self, command: str, error: Exception) -> None:
+        self._finish("failed")
+        self.messages.append(f"❌ Error in {command}: {error}")
+
+    def close(self) -> None:
+        """Stop the live panel and show everything that was deferred while it ran."""
+        self._stop()
+        if self.messages:
+            message_dialog(
+                title="Linguist",
+                text="\n\n".join(self.messages),
+                style=self.style
+            ).run()
+        self.messages = []
+
+    def _active(self) -> Optional[Job]:
+        running = [job for job in self.jobs if job.finished is None]
+        return running[0] if running else None
+
+    def _start(self, command: str) -> Job:
+        job = Job(command=command, started=time.monotonic())
+        with self._lock:
+            self.jobs.append(job)
+        self._run()
+        return job
+
+    def _finish(self, status: str) -> Optional[Job]:
+        with self._lock:
+            job = self._active()
+            if job:
+                job.finished = time.monotonic()
+                job.status = status
+        return job
+
+    def _render(self):
+        with self._lock:
+            jobs = list(self.jobs)
+        pending = [job for job in jobs if job.finished is None]
+        lines = []
+        for index, job in enumerate(jobs, start=1):
+            position = f"{pending.index(job) + 1}/{len(pending)}" if job in pending else job.status
+            audio = f"{job.processed:7.1f}s"
+            if job.total:
+                audio += f" / {job.total:.1f}s"
+            elif job.command == "recording" and job.finished is None:
+                audio = f"{job.elapsed:7.1f}s"
+            rtf = f"{job.rtf:.2f}" if job.rtf else "-"
+            lines.append(
+                f"<b>{index:>2}. {job.command:<13}</b> [{position:>11}] "
+                f"audio {audio:<18} elapsed {job.elapsed:6.1f}s  RTF {rtf}\n"
+            )
+        hint = "Enter" if any(job.command == "recording" for job in pending) else "Ctrl+C"
+        lines.append(f"\n<i>Press {hint} to stop.</i>")
+        return HTML("".join(lines))
+
+    def _run(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        bindings = KeyBindings()
+        # Enter only stops a recording; other jobs would lose their work to a stray keypress.
+        recording = Condition(lambda: any(
+            job.command == "recording" and job.finished is None for job in list(self.jobs)
+        ))
+
+        @bindings.add("c-c")
+        @bindings.add("enter", filter=recording)
+        def _(event):
+            # Commands stop on KeyboardInterrupt, which only the main thread can receive.
+            _thread.interrupt_main()
+
+        self._app = Application(
+            layout=Layout(Window(FormattedTextControl(self._render))),
+            key_bindings=bindings,
+            style=self.style,
+            refresh_interval=self.refresh_interval,
+            full_screen=False
+        )
+        self._thread = Thread(target=self._app.run, daemon=True)
+        self._thread.start()
+
+    def _stop(self) -> None:
+        if not (self._thread and self._thread.is_alive()):
+            return
+        while not self._app.is_running and self._thread.is_alive():
+            time.sleep(0.01)
+        if self._app.is_running:
+            self._app.loop.call_soon_threadsafe(self._app.exit)
+        self._thread.join()
+        self._app = None
+        self._thread = None